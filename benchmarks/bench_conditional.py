@@ -0,0 +1,95 @@
+"""
+Compares the cost of a 304 Not Modified response built from presenter fingerprints
+against a full presenter render of the same list page.
+
+Each timed call builds a fresh request, so the objects are fetched on every 304 as
+they would be in production. ``objects_func`` builds the objects from in-memory rows,
+mimicking ORM model instantiation; database round-trip latency is not simulated and
+would add the same cost to both paths.
+
+Run from the repository root with ``PYTHONPATH=. python benchmarks/bench_conditional.py [object_count]``.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from timeit import repeat
+
+import django
+from django.conf import settings
+
+settings.configure(
+    SECRET_KEY="benchmark-only",
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates"}],
+)
+django.setup()
+
+from django.http import HttpResponse  # noqa: E402
+from django.template import engines  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.views.decorators.http import condition  # noqa: E402
+
+from python_presenter import BasePresenter, presenter_etag  # noqa: E402
+
+TEMPLATE = engines["django"].from_string("""
+    {% for project in projects %}
+        <li><strong>{{ project.labels.project_name }}:</strong> {{ project.project_name }}</li>
+        <li><strong>{{ project.labels.price_detail }}:</strong> {{ project.price_detail }}</li>
+    {% endfor %}
+    """)
+
+
+@dataclass
+class Project:
+    pk: int
+    name: str
+    price: int
+    updated_at: datetime
+
+
+class ProjectPresenter(BasePresenter):
+    def project_name(self):
+        return self.obj.name.title()
+
+    def price_detail(self):
+        return f"${self.obj.price:,.2f}"
+
+    @property
+    def labels(self):
+        return {"project_name": "Project Name", "price_detail": "Price Detail"}
+
+
+def build_view(rows):
+    def objects_func(request):
+        return [Project(*row) for row in rows]
+
+    @condition(etag_func=presenter_etag(objects_func, ProjectPresenter))
+    def project_list(request):
+        presented = [ProjectPresenter(project) for project in objects_func(request)]
+        return HttpResponse(TEMPLATE.render({"projects": presented}))
+
+    return project_list
+
+
+def main(count=500, number=50):
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [(i, f"project {i}", i * 1000, started + timedelta(minutes=i)) for i in range(count)]
+    view = build_view(rows)
+    factory = RequestFactory()
+
+    etag = view(factory.get("/projects/"))["ETag"]
+    assert view(factory.get("/projects/", HTTP_IF_NONE_MATCH=etag)).status_code == 304
+
+    full = min(repeat(lambda: view(factory.get("/projects/")), number=number, repeat=5)) / number
+    not_modified = (
+        min(repeat(lambda: view(factory.get("/projects/", HTTP_IF_NONE_MATCH=etag)), number=number, repeat=5)) / number
+    )
+
+    print(f"objects:        {count}")
+    print(f"full render:    {full * 1000:.3f} ms")
+    print(f"304 response:   {not_modified * 1000:.3f} ms")
+    print(f"speedup:        {full / not_modified:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
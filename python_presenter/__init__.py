@@ -1,4 +1,5 @@
 # Allow direct access to the base client and other methods.
 from python_presenter.core.presenters.base_presenter import BasePresenter
+from python_presenter.core.presenters.conditional import presenter_etag, presenter_fingerprint
 from python_presenter.core.presenters.presenter_helper import present
 from python_presenter.core.templatetags.presenter_tag import present_object
@@ -3,6 +3,10 @@ class BasePresenter:
     This is initializers for object and content view.
     """
 
+    # Bump when presenter output changes without the underlying objects changing,
+    # so conditional responses built from presenter fingerprints are invalidated.
+    presenter_version = 1
+
     def __init__(self, obj, view_context=None):
         self.obj = obj
         self.view_context = view_context
@@ -0,0 +1,86 @@
+from hashlib import sha256
+
+from python_presenter.core.presenters.presenter_helper import resolve_presenter_class
+
+
+def _presenter_signature(presenter_class):
+    """
+    Identifies a presenter class and the version of its code.
+    """
+    version = getattr(presenter_class, "presenter_version", None)
+    return f"{presenter_class.__module__}.{presenter_class.__qualname__}:{version}"
+
+
+def _timestamp(value):
+    return value.isoformat() if hasattr(value, "isoformat") else repr(value)
+
+
+def _objects_for(objects_func, request, args, kwargs):
+    """
+    Fetches the objects once per request and set of view arguments, so ``etag_func``
+    built from the same ``objects_func`` shares a single query however often it is
+    evaluated. Callables or arguments that cannot be hashed are simply not cached.
+    """
+    key = (objects_func, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return list(objects_func(request, *args, **kwargs))
+
+    cache = getattr(request, "_presenter_objects", None)
+    if cache is None:
+        cache = {}
+        setattr(request, "_presenter_objects", cache)
+    if key not in cache:
+        cache[key] = list(objects_func(request, *args, **kwargs))
+    return cache[key]
+
+
+def presenter_fingerprint(objects, presenter_class=None, key_attr="pk", timestamp_attr="updated_at"):
+    """
+    Derives a stable fingerprint for a page from the presenters involved and the
+    objects' keys and timestamps. Presenters are resolved but never instantiated,
+    so no presenter field is evaluated.
+
+    Args:
+        objects: The objects rendered on the page
+        presenter_class: Optional presenter class used for every object
+        key_attr: The attribute identifying each object
+        timestamp_attr: The attribute holding each object's last modification time
+
+    Returns:
+        A hex digest that changes whenever a presenter, its version, or an object changes
+    """
+    digest = sha256()
+    if presenter_class is not None:
+        digest.update(f"{_presenter_signature(presenter_class)}\n".encode())
+    signatures = {}
+    for obj in objects:
+        obj_class = obj.__class__
+        if obj_class not in signatures:
+            signatures[obj_class] = _presenter_signature(resolve_presenter_class(obj, presenter_class))
+        key = getattr(obj, key_attr, None)
+        timestamp = getattr(obj, timestamp_attr, None)
+        digest.update(f"{signatures[obj_class]}|{key!r}|{_timestamp(timestamp)}\n".encode())
+    return digest.hexdigest()
+
+
+def presenter_etag(objects_func, presenter_class=None, key_attr="pk", timestamp_attr="updated_at"):
+    """
+    Builds an ``etag_func`` for Django's ``condition()`` decorator.
+
+    Args:
+        objects_func: Callable taking the view's arguments and returning the objects to present
+        presenter_class: Optional presenter class used for every object
+        key_attr: The attribute identifying each object
+        timestamp_attr: The attribute holding each object's last modification time
+
+    Returns:
+        A function of ``(request, *args, **kwargs)`` returning the page fingerprint
+    """
+
+    def etag_func(request, *args, **kwargs):
+        objects = _objects_for(objects_func, request, args, kwargs)
+        return presenter_fingerprint(objects, presenter_class, key_attr=key_attr, timestamp_attr=timestamp_attr)
+
+    return etag_func
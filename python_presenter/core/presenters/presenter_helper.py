@@ -2,18 +2,16 @@ from importlib import import_module
 from inspect import getmodule
 
 
-def present(obj, presenter_class=None, context=None):
+def resolve_presenter_class(obj, presenter_class=None):
     """
-    Presents an object using either a provided presenter class or auto-discovers
-    the appropriate presenter class from the object's module.
+    Resolves the presenter class for an object without instantiating it.
 
     Args:
         obj: The object to be presented
         presenter_class: Optional presenter class to use
-        context: Optional template context to use
 
     Returns:
-        An instance of the presenter class initialized with the object
+        The provided presenter class, or the one auto-discovered from the object's module
     """
     if presenter_class is None:
         presenter_class = f"{obj.__class__.__name__}Presenter"
@@ -21,4 +19,21 @@ def present(obj, presenter_class=None, context=None):
         presenter_module = f"{current_module}.presenter"
         module = import_module(presenter_module)
         presenter_class = getattr(module, presenter_class)
+    return presenter_class
+
+
+def present(obj, presenter_class=None, context=None):
+    """
+    Presents an object using either a provided presenter class or auto-discovers
+    the appropriate presenter class from the object's module.
+
+    Args:
+        obj: The object to be presented
+        presenter_class: Optional presenter class to use
+        context: Optional template context to use
+
+    Returns:
+        An instance of the presenter class initialized with the object
+    """
+    presenter_class = resolve_presenter_class(obj, presenter_class)
     return presenter_class(obj, context=context)
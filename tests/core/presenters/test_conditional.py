@@ -0,0 +1,213 @@
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import ModuleType
+from unittest.mock import Mock, patch
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.views.decorators.http import condition
+
+from python_presenter.core.presenters.base_presenter import BasePresenter
+from python_presenter.core.presenters.conditional import presenter_etag, presenter_fingerprint
+
+
+@dataclass
+class Project:
+    pk: int
+    name: str
+    updated_at: datetime = None
+
+
+class ProjectPresenter(BasePresenter):
+    def __init__(self, obj, view_context=None):
+        raise AssertionError("presenters must not be instantiated")
+
+
+class NewProjectPresenter(ProjectPresenter):
+    presenter_version = 2
+
+
+@pytest.fixture
+def projects():
+    return [
+        Project(1, "Alpha", datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        Project(2, "Beta", datetime(2024, 3, 1, tzinfo=timezone.utc)),
+    ]
+
+
+class TestPresenterFingerprint:
+    def test_fingerprint_is_stable(self, projects):
+        """Test the same objects and presenter always produce the same fingerprint"""
+        assert presenter_fingerprint(projects, ProjectPresenter) == presenter_fingerprint(projects, ProjectPresenter)
+
+    def test_fingerprint_changes_with_timestamp(self, projects):
+        """Test updating an object changes the fingerprint"""
+        before = presenter_fingerprint(projects, ProjectPresenter)
+        projects[0].updated_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+        assert presenter_fingerprint(projects, ProjectPresenter) != before
+
+    def test_fingerprint_changes_with_keys(self, projects):
+        """Test adding or removing objects changes the fingerprint"""
+        assert presenter_fingerprint(projects, ProjectPresenter) != presenter_fingerprint(
+            projects[:1], ProjectPresenter
+        )
+
+    def test_fingerprint_changes_with_presenter_version(self, projects):
+        """Test bumping the presenter version changes the fingerprint"""
+        assert presenter_fingerprint(projects, ProjectPresenter) != presenter_fingerprint(projects, NewProjectPresenter)
+
+    def test_empty_fingerprint_changes_with_presenter_version(self):
+        """Test an empty page still changes its fingerprint when the presenter version is bumped"""
+        assert presenter_fingerprint([], ProjectPresenter) != presenter_fingerprint([], NewProjectPresenter)
+
+    def test_fingerprint_ignores_untracked_fields(self, projects):
+        """Test fields other than the key and timestamp do not affect the fingerprint"""
+        before = presenter_fingerprint(projects, ProjectPresenter)
+        projects[0].name = "Renamed"
+
+        assert presenter_fingerprint(projects, ProjectPresenter) == before
+
+    def test_fingerprint_with_custom_key_attr(self, projects):
+        """Test a custom key attribute is used"""
+        by_name = presenter_fingerprint(projects, ProjectPresenter, key_attr="name")
+        projects[0].name = "Renamed"
+
+        assert presenter_fingerprint(projects, ProjectPresenter, key_attr="name") != by_name
+
+    def test_fingerprint_with_custom_timestamp_attr(self, projects):
+        """Test a custom timestamp attribute is read instead of updated_at"""
+        projects[0].modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        before = presenter_fingerprint(projects, ProjectPresenter, timestamp_attr="modified")
+        projects[0].modified = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+        assert presenter_fingerprint(projects, ProjectPresenter, timestamp_attr="modified") != before
+
+    def test_fingerprint_resolves_presenter_once_per_class(self, projects):
+        """Test auto-discovery runs once per object class"""
+        with patch(
+            "python_presenter.core.presenters.conditional.resolve_presenter_class", return_value=ProjectPresenter
+        ) as mock_resolve:
+            presenter_fingerprint(projects)
+
+        mock_resolve.assert_called_once_with(projects[0], None)
+
+    def test_fingerprint_never_instantiates_presenter(self, projects, monkeypatch):
+        """Test an auto-discovered presenter is resolved without being instantiated"""
+        presenter_module = ModuleType(f"{Project.__module__.rsplit('.', 1)[0]}.presenter")
+        presenter_module.ProjectPresenter = ProjectPresenter
+        monkeypatch.setitem(sys.modules, presenter_module.__name__, presenter_module)
+
+        before = presenter_fingerprint(projects)
+        presenter_module.ProjectPresenter = NewProjectPresenter
+
+        assert presenter_fingerprint(projects) != before
+
+
+@pytest.fixture
+def get_request():
+    return RequestFactory().get("/projects/")
+
+
+class TestPresenterConditionalFuncs:
+    def test_presenter_etag_passes_view_arguments(self, projects, get_request):
+        """Test the etag function forwards the view arguments to the objects callable"""
+        etag_func = presenter_etag(lambda request, category: projects, ProjectPresenter)
+
+        assert etag_func(get_request, category="homes") == presenter_fingerprint(projects, ProjectPresenter)
+
+    def test_presenter_etag_forwards_custom_attributes(self, projects):
+        """Test the etag function reads the configured key and timestamp attributes"""
+        etag_func = presenter_etag(
+            lambda request: projects, ProjectPresenter, key_attr="name", timestamp_attr="modified"
+        )
+        projects[0].modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        before = etag_func(RequestFactory().get("/projects/"))
+
+        projects[0].modified = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        after_timestamp = etag_func(RequestFactory().get("/projects/"))
+        projects[0].name = "Renamed"
+        after_key = etag_func(RequestFactory().get("/projects/"))
+
+        assert len({before, after_timestamp, after_key}) == 3
+        assert after_key == presenter_fingerprint(
+            projects, ProjectPresenter, key_attr="name", timestamp_attr="modified"
+        )
+
+    def test_objects_fetched_once_per_request(self, projects, get_request):
+        """Test etag functions sharing an objects_func make one call per request"""
+        objects_func = Mock(side_effect=lambda request: iter(projects))
+
+        presenter_etag(objects_func, ProjectPresenter)(get_request)
+        presenter_etag(objects_func, NewProjectPresenter)(get_request)
+        presenter_etag(objects_func, ProjectPresenter)(RequestFactory().get("/projects/"))
+
+        assert objects_func.call_count == 2
+
+    def test_objects_cached_per_view_arguments(self, projects, get_request):
+        """Test different view arguments on the same request fetch their own objects"""
+        objects_func = Mock(side_effect=lambda request, category: projects[:1] if category == "homes" else projects)
+        etag_func = presenter_etag(objects_func, ProjectPresenter)
+
+        homes = etag_func(get_request, category="homes")
+        offices = etag_func(get_request, category="offices")
+
+        assert homes == presenter_fingerprint(projects[:1], ProjectPresenter)
+        assert offices == presenter_fingerprint(projects, ProjectPresenter)
+        assert objects_func.call_count == 2
+
+    def test_unhashable_objects_func_is_not_cached(self, projects, get_request):
+        """Test a callable without __hash__ still works and is called on every evaluation"""
+
+        class ProjectsQuery:
+            calls = 0
+
+            def __eq__(self, other):
+                return isinstance(other, ProjectsQuery)
+
+            def __call__(self, request):
+                ProjectsQuery.calls += 1
+                return projects
+
+        etag_func = presenter_etag(ProjectsQuery(), ProjectPresenter)
+
+        assert etag_func(get_request) == etag_func(get_request) == presenter_fingerprint(projects, ProjectPresenter)
+        assert ProjectsQuery.calls == 2
+
+
+class TestDjangoCondition:
+    @pytest.fixture
+    def view(self, projects):
+        objects_func = lambda request: projects  # noqa: E731
+        rendered = []
+
+        @condition(etag_func=presenter_etag(objects_func, ProjectPresenter))
+        def project_list(request):
+            rendered.append(request)
+            return HttpResponse("rendered")
+
+        project_list.rendered = rendered
+        return project_list
+
+    def test_unchanged_page_returns_not_modified_without_rendering(self, view):
+        """Test a matching If-None-Match short-circuits before the view renders"""
+        factory = RequestFactory()
+        etag = view(factory.get("/projects/"))["ETag"]
+
+        response = view(factory.get("/projects/", HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == 304
+        assert len(view.rendered) == 1
+
+    def test_changed_page_renders(self, view, projects):
+        """Test a stale ETag results in a full render"""
+        factory = RequestFactory()
+        etag = view(factory.get("/projects/"))["ETag"]
+        projects[1].updated_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+        response = view(factory.get("/projects/", HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == 200
+        assert len(view.rendered) == 2